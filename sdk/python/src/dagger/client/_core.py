@@ -1,8 +1,12 @@
+import contextvars
 import functools
+import itertools
 import logging
+import os
+import types
 import typing
-from collections import deque
-from dataclasses import MISSING, asdict, dataclass, field, replace
+import weakref
+from dataclasses import MISSING, asdict, dataclass, field, fields, is_dataclass
 from typing import (
     Any,
     TypeVar,
@@ -14,10 +18,17 @@ import anyio
 import cattrs
 import graphql
 import httpx
-from beartype.door import TypeHint
 from cattrs.preconf.json import make_converter
 from gql.client import AsyncClientSession
-from gql.dsl import DSLField, DSLQuery, DSLSchema, DSLSelectable, DSLType, dsl_gql
+from gql.dsl import (
+    DSLField,
+    DSLQuery,
+    DSLSchema,
+    DSLSelectable,
+    DSLType,
+    DSLVariableDefinitions,
+    dsl_gql,
+)
 from gql.transport.exceptions import (
     TransportClosed,
     TransportProtocolError,
@@ -33,11 +44,11 @@ from dagger import (
 from dagger._exceptions import _query_error_from_transport
 from dagger.client._guards import (
     IDType,
-    InputHint,
-    InputSeqHint,
     is_id_type,
     is_id_type_sequence,
     is_id_type_subclass,
+    is_input_sequence,
+    is_input_type,
 )
 from dagger.client.base import Scalar, Type
 
@@ -45,6 +56,47 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# How many pending IDs to resolve in a single combined query.
+_MAX_ID_BATCH = 50
+
+# Shared for every selection without arguments; must never be mutated
+# (resolve_ids only writes keys it has read, so it can't touch this).
+_NO_ARGS: dict[str, Any] = {}
+
+
+def _contains_dataclass(t: Any) -> bool:
+    if isinstance(t, type) and is_dataclass(t):
+        return True
+    return any(_contains_dataclass(a) for a in typing.get_args(t))
+
+
+@functools.cache
+def _input_serializer(cls: type) -> typing.Callable[[Any], dict[str, Any]]:
+    """Generate a flat dict-building function for an Input dataclass.
+
+    Replaces `dataclasses.asdict`, which walks fields reflectively and
+    deep-copies every value on each call. Field access is compiled into
+    a straight dict literal; nested input serializers are inlined as
+    precompiled calls.
+    """
+    hints = get_type_hints(cls)
+    ns: dict[str, Any] = {}
+    parts = []
+    for i, f in enumerate(fields(cls)):
+        t = hints.get(f.name, f.type)
+        if isinstance(t, type) and is_dataclass(t):
+            ns[f"_s{i}"] = _input_serializer(t)
+            parts.append(f"{f.name!r}: _s{i}(obj.{f.name})")
+        elif _contains_dataclass(t):
+            # containers of dataclasses need a recursive walk
+            return asdict
+        else:
+            parts.append(f"{f.name!r}: obj.{f.name}")
+
+    src = "def _serialize(obj):\n    return {" + ", ".join(parts) + "}"
+    exec(src, ns)  # noqa: S102
+    return ns["_serialize"]
+
 
 class Arg(typing.NamedTuple):
     name: str  # GraphQL name
@@ -52,13 +104,35 @@ class Arg(typing.NamedTuple):
     default: Any = MISSING
 
     def as_input(self):
-        if InputHint.is_bearable(self.value):
-            return asdict(self.value)
-        if InputSeqHint.is_bearable(self.value):
-            return [asdict(v) for v in self.value]
+        if is_input_type(self.value):
+            return _input_serializer(type(self.value))(self.value)
+        if is_input_sequence(self.value):
+            return [_input_serializer(type(v))(v) for v in self.value]
         return self.value
 
 
+@functools.lru_cache(maxsize=8)
+def _dsl_schema(schema: graphql.GraphQLSchema) -> DSLSchema:
+    """One DSLSchema per introspected schema.
+
+    The schema object is immutable after the engine handshake, so every
+    Root created from the same session can share the wrapper — which
+    also keeps the type and compiled-document caches warm across Roots.
+    """
+    return DSLSchema(schema)
+
+
+@functools.lru_cache(maxsize=1024)
+def _dsl_type(schema: DSLSchema, type_name: str) -> DSLType:
+    """One shared DSLType wrapper per schema type.
+
+    DSLSchema.__getattr__ builds a fresh wrapper per access; they're
+    stateless, so share them. (DSLFields are mutated when called with
+    arguments and must stay per-use.)
+    """
+    return getattr(schema, type_name)
+
+
 @dataclass(slots=True)
 class Field:
     type_name: str
@@ -67,7 +141,7 @@ class Field:
     children: dict[str, "Field"] = field(default_factory=dict)
 
     def to_dsl(self, schema: DSLSchema) -> DSLField:
-        type_: DSLType = getattr(schema, self.type_name)
+        type_ = _dsl_type(schema, self.type_name)
         field_ = getattr(type_, self.name)(**self.args)
         if self.children:
             field_ = field_.select(
@@ -75,85 +149,530 @@ class Field:
             )
         return field_
 
-    def add_child(self, child: "Field") -> "Field":
-        return replace(self, children={child.name: child})
+    def signature(self) -> tuple:
+        """Hashable key describing the shape of this selection.
+
+        Two fields with the same signature produce the same GraphQL
+        document, differing only in argument values.
+        """
+        return (
+            self.type_name,
+            self.name,
+            tuple(sorted(self.args)),
+            tuple((alias, child.signature()) for alias, child in self.children.items()),
+        )
+
+
+# Compiled documents by selection shape. A plain dict keyed on
+# signatures — not an lru_cache over the fields themselves — so cached
+# entries hold only the document and variable names, never argument
+# values or unresolved Type instances (which would pin their sessions
+# past connection close). Bounded FIFO, like a small lru_cache.
+_DOCUMENT_CACHE: dict[tuple, tuple[graphql.DocumentNode, tuple[str, ...]]] = {}
+_DOCUMENT_CACHE_SIZE = 128
+
+
+def _compile_query(
+    fields: tuple[Field, ...], schema: DSLSchema
+) -> tuple[graphql.DocumentNode, tuple[str, ...]]:
+    """Build the GraphQL document for a selection shape, once.
+
+    Argument values are lifted into GraphQL variables (``$v0``, ``$v1``, ...)
+    so the compiled document can be reused by any pipeline with the same
+    shape. Returns the document and the variable names, in the same
+    deterministic order that `_query_variables` collects values.
+    """
+    key = (schema, tuple(f.signature() for f in fields))
+    if (cached := _DOCUMENT_CACHE.get(key)) is not None:
+        return cached
+
+    var_defs = DSLVariableDefinitions()
+    names: list[str] = []
+    counter = itertools.count()
+
+    def _to_dsl(field_: Field) -> DSLField:
+        type_ = _dsl_type(schema, field_.type_name)
+        args = {}
+        for arg_name in sorted(field_.args):
+            var_name = f"v{next(counter)}"
+            names.append(var_name)
+            args[arg_name] = getattr(var_defs, var_name)
+        dsl = getattr(type_, field_.name)(**args)
+        if field_.children:
+            dsl = dsl.select(
+                **{name: _to_dsl(child) for name, child in field_.children.items()}
+            )
+        return dsl
+
+    # assign variable names in selection order, then nest right-to-left
+    nodes = [_to_dsl(field_) for field_ in fields]
+    selectable = nodes[-1]
+    for node in reversed(nodes[:-1]):
+        selectable = node.select(selectable)
+
+    operation = DSLQuery(selectable)
+    operation.variable_definitions = var_defs
+
+    if len(_DOCUMENT_CACHE) >= _DOCUMENT_CACHE_SIZE:
+        del _DOCUMENT_CACHE[next(iter(_DOCUMENT_CACHE))]
+    compiled = _DOCUMENT_CACHE[key] = dsl_gql(operation), tuple(names)
+    return compiled
+
+
+# Return types whose response value is already the right Python type
+# straight out of the JSON decoder.
+_SCALAR_IDENTITY = frozenset({str, int, float, bool})
+
+
+@functools.cache
+def _is_scalar_class(t: Any) -> bool:
+    return isinstance(t, type) and issubclass(t, Scalar)
+
+
+@functools.cache
+def _accepts_none(t: Any) -> bool:
+    """Whether None is a valid value for this type hint."""
+    if t is None or t is type(None) or t is Any:
+        return True
+    origin = typing.get_origin(t)
+    if origin is typing.Union or origin is types.UnionType:
+        return any(_accepts_none(arg) for arg in typing.get_args(t))
+    return False
+
+
+class _PendingExecution:
+    """A single execution waiting to be submitted in a batch."""
+
+    __slots__ = ("document", "variables", "result", "error", "done", "_event")
+
+    def __init__(self, document: graphql.DocumentNode, variables: dict[str, Any]):
+        self.document = document
+        self.variables = variables
+        self.result: Any = None
+        self.error: Exception | None = None
+        self.done = False
+        self._event = anyio.Event()
+
+    def set(  # noqa: A003
+        self, result: Any = None, error: Exception | None = None
+    ) -> None:
+        self.result = result
+        self.error = error
+        self.done = True
+        self._event.set()
+
+    async def wait(self) -> None:
+        await self._event.wait()
+
+
+def _root_field_name(document: graphql.DocumentNode) -> str:
+    op = document.definitions[0]
+    return op.selection_set.selections[0].name.value
+
+
+class _PrefixVariables(graphql.Visitor):
+    """Rename every `$name` to `$<prefix>_name`.
+
+    Keeps variables from separate operations from colliding when their
+    selections are merged into one document.
+    """
+
+    def __init__(self, prefix: str):
+        super().__init__()
+        self.prefix = prefix
+
+    def enter_variable(self, node: graphql.VariableNode, *_):
+        return graphql.VariableNode(
+            name=graphql.NameNode(value=f"{self.prefix}_{node.name.value}")
+        )
+
+
+def _merge_pending(
+    pending: "list[_PendingExecution]",
+) -> tuple[graphql.DocumentNode, dict[str, Any]]:
+    """Pack pending executions into one aliased multi-selection document."""
+    var_defs: list[graphql.VariableDefinitionNode] = []
+    selections: list[graphql.FieldNode] = []
+    variables: dict[str, Any] = {}
+
+    for i, item in enumerate(pending):
+        prefix = f"q{i}"
+        # the cached document is shared; visit() produces new nodes
+        op = graphql.visit(item.document.definitions[0], _PrefixVariables(prefix))
+        var_defs.extend(op.variable_definitions or ())
+        root = op.selection_set.selections[0]
+        selections.append(
+            graphql.FieldNode(
+                alias=graphql.NameNode(value=prefix),
+                name=root.name,
+                arguments=root.arguments,
+                directives=root.directives,
+                selection_set=root.selection_set,
+            )
+        )
+        variables.update({f"{prefix}_{k}": v for k, v in item.variables.items()})
+
+    operation = graphql.OperationDefinitionNode(
+        operation=graphql.OperationType.QUERY,
+        variable_definitions=tuple(var_defs),
+        selection_set=graphql.SelectionSetNode(selections=tuple(selections)),
+    )
+    return graphql.DocumentNode(definitions=(operation,)), variables
+
+
+class _ExecuteBatcher:
+    """Merge concurrent executions into single multi-operation requests.
+
+    Executions that arrive within a short window are packed into one
+    aliased GraphQL document, collapsing N concurrent awaits into one
+    network round trip. The first arrival owns the window; later ones
+    just wait for their share of the result.
+    """
+
+    # Sweet spot between packing enough queries and not delaying
+    # the first one noticeably.
+    window = 0.001
+    max_batch = 16
+
+    def __init__(self, session: AsyncClientSession):
+        self.session = session
+        self._pending: list[_PendingExecution] = []
+
+    async def execute(
+        self,
+        document: graphql.DocumentNode,
+        variable_values: dict[str, Any] | None = None,
+    ) -> Any:
+        item = _PendingExecution(document, variable_values or {})
+        self._pending.append(item)
+
+        if len(self._pending) >= self.max_batch:
+            await self._flush()
+        elif len(self._pending) == 1:
+            try:
+                await anyio.sleep(self.window)
+            except BaseException:
+                # don't leave the other waiters hanging
+                with anyio.CancelScope(shield=True):
+                    await self._flush()
+                raise
+            await self._flush()
+
+        if not item.done:
+            await item.wait()
+        if item.error is not None:
+            raise item.error
+        return item.result
+
+    async def _flush(self) -> None:
+        pending = [item for item in self._pending if not item.done]
+        self._pending = []
+        if not pending:
+            return
+
+        try:
+            if len(pending) == 1:
+                await self._submit_one(pending[0])
+            else:
+                await self._submit_merged(pending)
+        except BaseException as e:
+            # The flushing task got cancelled; the other waiters must
+            # still be released or they'd hang forever.
+            msg = f"Batched request interrupted: {type(e).__name__}"
+            for item in pending:
+                if not item.done:
+                    item.set(error=TransportError(msg))
+            raise
+
+    async def _submit_one(self, item: _PendingExecution) -> None:
+        try:
+            result = await self.session.execute(
+                item.document, variable_values=item.variables
+            )
+        except Exception as e:  # noqa: BLE001
+            item.set(error=e)
+        else:
+            item.set(result)
+
+    async def _submit_merged(self, pending: "list[_PendingExecution]") -> None:
+        document, variables = _merge_pending(pending)
+        try:
+            result = await self.session.execute(document, variable_values=variables)
+        except TransportQueryError as e:
+            self._fan_out_error(pending, e)
+        except Exception as e:  # noqa: BLE001
+            for item in pending:
+                item.set(error=e)
+        else:
+            for i, item in enumerate(pending):
+                name = _root_field_name(item.document)
+                item.set({name: result.get(f"q{i}")})
+
+    @staticmethod
+    def _fan_out_error(
+        pending: list[_PendingExecution], exc: TransportQueryError
+    ) -> None:
+        """Raise each sub-query's errors only on its own execution."""
+        errors = exc.errors or []
+        unscoped = [e for e in errors if not (isinstance(e, dict) and e.get("path"))]
+
+        for i, item in enumerate(pending):
+            prefix = f"q{i}"
+            name = _root_field_name(item.document)
+            own = list(unscoped)
+            for e in errors:
+                path = e.get("path") if isinstance(e, dict) else None
+                if path and path[0] == prefix:
+                    # translate the alias back to the field name
+                    own.append({**e, "path": [name, *path[1:]]})
+            if own:
+                item.set(
+                    error=TransportQueryError(str(exc), errors=own, data=exc.data)
+                )
+            else:
+                data = exc.data or {}
+                item.set({name: data.get(prefix)})
+
+
+# Batching is opt-in, per session: a short debounce window trades a
+# little latency on isolated calls for far fewer round trips when many
+# independent queries are awaited concurrently.
+_BATCH_EXECUTIONS_ENV = "DAGGER_BATCH_EXECUTIONS"
+_BATCHERS: "weakref.WeakKeyDictionary[AsyncClientSession, _ExecuteBatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _batching_enabled() -> bool:
+    return os.environ.get(_BATCH_EXECUTIONS_ENV, "").lower() not in (
+        "",
+        "0",
+        "false",
+        "no",
+    )
+
+
+@functools.cache
+def _result_walker(path: tuple[str, ...]) -> typing.Callable[[Any], Any]:
+    """Compile the response walk for a result path, once per unique path.
+
+    Keeps the original semantics: stop early (returning the current
+    value) as soon as a non-dict is reached, e.g. a null parent field.
+    """
+    lines = ["def _walk(value):"]
+    for name in path:
+        lines.append("    if not isinstance(value, dict):")
+        lines.append("        return value")
+        lines.append(f"    value = value[{name!r}]")
+    lines.append("    return value")
+
+    ns: dict[str, Any] = {}
+    exec("\n".join(lines), ns)  # noqa: S102
+    return ns["_walk"]
+
+
+# The Context whose response is currently being structured. Lets the
+# shared converter hand new Type instances their Context without
+# closing over one.
+_current_context: contextvars.ContextVar["Context"] = contextvars.ContextVar(
+    "_current_context"
+)
+
+# Type subclasses are immutable at runtime so resolving their
+# annotations once is safe.
+_type_hints = functools.cache(get_type_hints)
+
+
+@functools.cache
+def _compiled_struct(cls: type) -> typing.Callable[[dict[str, Any]], Any]:
+    """Generate a structuring function specialized for a Type subclass.
+
+    The slot x type-hint table is resolved once per class and compiled
+    into straight-line attribute assignments, instead of iterating
+    `__slots__` and looking up hints per response object.
+    """
+    # Type.__init_subclass__ resolves hints at class creation; classes
+    # whose forward references weren't resolvable then are done lazily.
+    hints = cls.__dict__.get("__dagger_hints__") or _type_hints(cls)
+    slots = tuple(
+        (slot, hints[slot]) for slot in getattr(cls, "__slots__", ()) if slot in hints
+    )
+
+    ns: dict[str, Any] = {
+        "_cls": cls,
+        "_get_ctx": _current_context.get,
+        "_structure": _CONVERTER.structure,
+        "_MISSING": MISSING,
+    }
+    lines = ["def _struct_fn(d):", "    obj = _cls(_get_ctx())"]
+    for i, (slot, t) in enumerate(slots):
+        ns[f"_t{i}"] = t
+        lines.append(f"    v = d.get({slot!r}, _MISSING)")
+        lines.append("    if v is not _MISSING:")
+        lines.append(f"        obj.{slot} = _structure(v, _t{i})")
+    lines.append("    return obj")
+
+    exec("\n".join(lines), ns)  # noqa: S102
+    return ns["_struct_fn"]
+
+
+def _make_converter() -> cattrs.Converter:
+    conv = make_converter(detailed_validation=False)
+
+    # For types that were returned from a list we need to set
+    # their private attributes with a custom structuring function.
+
+    def _needs_hook(cls: type) -> bool:
+        return issubclass(cls, Type) and hasattr(cls, "__slots__")
+
+    def _struct(d: dict[str, Any], cls: type) -> Any:
+        return _compiled_struct(cls)(d)
+
+    conv.register_structure_hook_func(
+        _needs_hook,
+        _struct,
+    )
+
+    return conv
+
+
+_CONVERTER = _make_converter()
+
+
+def _query_variables(fields: typing.Sequence[Field]) -> list[Any]:
+    """Collect argument values in the same order `_compile_query` names them."""
+    values: list[Any] = []
+
+    def _walk(field_: Field):
+        values.extend(field_.args[arg_name] for arg_name in sorted(field_.args))
+        for child in field_.children.values():
+            _walk(child)
+
+    for field_ in fields:
+        _walk(field_)
+    return values
 
 
 @dataclass(slots=True)
 class Context:
+    """A single selection in a pipeline, linked to its parent selection.
+
+    Contexts form a persistent singly linked list: `select` is O(1) and
+    forked pipelines share the common prefix instead of copying it.
+    """
+
     session: AsyncClientSession
     schema: DSLSchema
-    selections: deque[Field] = field(default_factory=deque)
-    converter: cattrs.Converter = field(init=False)
-
-    def __post_init__(self):
-        conv = make_converter(detailed_validation=False)
-
-        # For types that were returned from a list we need to set
-        # their private attributes with a custom structuring function.
-
-        def _needs_hook(cls: type) -> bool:
-            return issubclass(cls, Type) and hasattr(cls, "__slots__")
-
-        def _struct(d: dict[str, Any], cls: type) -> Any:
-            obj = cls(self)
-            hints = get_type_hints(cls)
-            for slot in getattr(cls, "__slots__", ()):
-                t = hints.get(slot)
-                if t and slot in d:
-                    setattr(obj, slot, conv.structure(d[slot], t))
-            return obj
-
-        conv.register_structure_hook_func(
-            _needs_hook,
-            _struct,
-        )
-
-        self.converter = conv
+    _selections: "tuple[Field, ...] | None" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _path: "tuple[str, ...] | None" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    parent: "Context | None" = None
+    field: Field | None = None
+
+    @property
+    def converter(self) -> cattrs.Converter:
+        return _CONVERTER
+
+    @property
+    def selections(self) -> tuple[Field, ...]:
+        """The pipeline's fields, in selection order.
+
+        Materialized once per Context, sharing the parent's tuple as
+        the prefix, so repeated walks (build, ID resolution, response
+        extraction) don't re-traverse the linked list.
+        """
+        if self._selections is None:
+            if self.field is None:
+                self._selections = ()
+            elif self.parent is None:
+                self._selections = (self.field,)
+            else:
+                self._selections = (*self.parent.selections, self.field)
+        return self._selections
+
+    @property
+    def path(self) -> tuple[str, ...]:
+        """The field names leading to this pipeline's result."""
+        if self._path is None:
+            if self.field is None:
+                self._path = ()
+            elif self.parent is None:
+                self._path = (self.field.name,)
+            else:
+                self._path = (*self.parent.path, self.field.name)
+        return self._path
 
     def select(
         self, type_name: str, field_name: str, args: typing.Sequence[Arg]
     ) -> "Context":
-        args_ = {
-            arg.name: arg.as_input() for arg in args if arg.value is not arg.default
-        }
+        args_: dict[str, Any] = _NO_ARGS
+        if args:
+            args_ = {
+                arg.name: arg.as_input() for arg in args if arg.value is not arg.default
+            } or _NO_ARGS
         field_ = Field(type_name, field_name, args_)
-        selections = self.selections.copy()
-        selections.append(field_)
-        return replace(self, selections=selections)
+        return Context(self.session, self.schema, parent=self, field=field_)
+
+    def select_raw(
+        self, type_name: str, field_name: str, args: dict[str, Any]
+    ) -> "Context":
+        """Like `select`, but for already-filtered and converted arguments.
+
+        Callers that know their argument values are plain GraphQL inputs
+        can skip `Arg` construction and the per-argument input checks.
+        """
+        field_ = Field(type_name, field_name, args)
+        return Context(self.session, self.schema, parent=self, field=field_)
 
     def select_multiple(self, type_name: str, **fields: str) -> "Context":
-        selections = self.selections.copy()
-        parent = selections.pop()
+        parent = self.field
+        assert parent is not None
         # When selecting multiple fields, set them as children of the last
-        # selection to make `build` logic simpler.
-        field_ = replace(
-            parent,
+        # selection to make `build` logic simpler. Constructed directly
+        # (dataclasses.replace would re-run __init__ and the children
+        # default factory just to discard them).
+        field_ = Field(
+            parent.type_name,
+            parent.name,
+            parent.args,
             # Using kwargs for alias names. This way the returned result
             # is already formatted with the python name we expect.
-            children={k: Field(type_name, v, {}) for k, v in fields.items()},
+            children={k: Field(type_name, v, _NO_ARGS) for k, v in fields.items()},
         )
-        selections.append(field_)
-        return replace(self, selections=selections)
+        return Context(self.session, self.schema, parent=self.parent, field=field_)
 
     def build(self) -> DSLSelectable:
-        if not self.selections:
+        selections = self.selections
+        if not selections:
             msg = "No field has been selected"
             raise InvalidQueryError(msg)
 
-        def _collapse(child: Field, field_: Field):
-            return field_.add_child(child)
-
-        # This transforms the selection set into a single root Field, where
-        # the `children` attribute is set to the next selection in the set,
-        # and so on...
-        root = functools.reduce(_collapse, reversed(self.selections))
-
-        # `to_dsl` will cascade to all children, until the end.
-        return root.to_dsl(self.schema)
+        # Nest each selection under its parent, right-to-left, building
+        # the DSL directly instead of collapsing into intermediate Fields.
+        selectable = None
+        for field_ in reversed(selections):
+            node = field_.to_dsl(self.schema)
+            if selectable is not None:
+                node = node.select(selectable)
+            selectable = node
+        return selectable
+
+    def query(self) -> tuple[graphql.DocumentNode, dict[str, Any]]:
+        """Compiled document for this pipeline plus its variable values.
+
+        The document is cached by selection shape so repeated executions
+        of the same pipeline shape skip the DSL/AST building entirely.
+        """
+        selections = self.selections
+        if not selections:
+            msg = "No field has been selected"
+            raise InvalidQueryError(msg)
 
-    def query(self) -> graphql.DocumentNode:
-        return dsl_gql(DSLQuery(self.build()))
+        doc, names = _compile_query(selections, self.schema)
+        return doc, dict(zip(names, _query_variables(selections), strict=True))
 
     @overload
     async def execute(self, return_type: None = None) -> None:
@@ -164,11 +683,22 @@ class Context:
         ...
 
     async def execute(self, return_type: type[T] | None = None) -> T | None:
-        await self.resolve_ids()
-        query = self.query()
+        query, variables = self.query()
+        await self._resolve_variables(variables)
+        result = await self._execute(query, variables)
+        return self.get_value(result, return_type) if return_type else None
 
+    async def _execute(
+        self,
+        query: graphql.DocumentNode,
+        variable_values: dict[str, Any] | None = None,
+        *,
+        batchable: bool = True,
+    ) -> Any:
         try:
-            result = await self.session.execute(query)
+            if batchable and (batcher := _BATCHERS.get(self.session)) is not None:
+                return await batcher.execute(query, variable_values=variable_values)
+            return await self.session.execute(query, variable_values=variable_values)
         except httpx.TimeoutException as e:
             msg = (
                 "Request timed out. Try setting a higher value in 'execute_timeout' "
@@ -196,8 +726,6 @@ class Context:
                 raise error from e
             raise
 
-        return self.get_value(result, return_type) if return_type else None
-
     @overload
     def get_value(self, value: None, return_type: Any) -> None:
         ...
@@ -207,46 +735,116 @@ class Context:
         ...
 
     def get_value(self, value: dict[str, Any] | None, return_type: type[T]) -> T | None:
-        type_hint = TypeHint(return_type)
-
-        for f in self.selections:
-            if not isinstance(value, dict):
-                break
-            value = value[f.name]
-
-        if value is None and not type_hint.is_bearable(value):
-            msg = (
-                "Required field got a null response. Check if parent fields are valid."
-            )
-            raise InvalidQueryError(msg)
-
-        return self.converter.structure(value, return_type)
+        value = _result_walker(self.path)(value)
+
+        if value is None:
+            if not _accepts_none(return_type):
+                msg = (
+                    "Required field got a null response. "
+                    "Check if parent fields are valid."
+                )
+                raise InvalidQueryError(msg)
+            return None
+
+        # JSON decoding already produced these, skip cattrs dispatch
+        if return_type in _SCALAR_IDENTITY:
+            return value
+        if _is_scalar_class(return_type):
+            return return_type(value)
+
+        token = _current_context.set(self)
+        try:
+            return _CONVERTER.structure(value, return_type)
+        finally:
+            _current_context.reset(token)
 
     async def resolve_ids(self) -> None:
-        """Replace Type object instances with their ID implicitly."""
-
-        # mutating to avoid re-fetching on forked pipeline
-        async def _resolve_id(pos: int, k: str, v: IDType):
-            sel = self.selections[pos]
-            sel.args[k] = await v.id()
+        """Replace Type object instances with their ID implicitly.
+
+        All pending IDs are fetched in a single request (or a few, for
+        very large fan-outs) by aliasing their `id` selections into one
+        combined query, instead of one round trip per object.
+        """
+        # each entry is (container, key, obj): container[key] is mutated
+        # in place so forked pipelines don't re-fetch
+        pending: list[tuple[Any, str | int, IDType]] = []
+
+        for sel in self.selections:
+            for k, v in sel.args.items():
+                # check if it's a sequence of Type objects
+                if is_id_type_sequence(v):
+                    # make sure it's a list, to mutate by index
+                    sel.args[k] = list(v)
+                    for seq_i, seq_v in enumerate(sel.args[k]):
+                        if is_id_type(seq_v):
+                            pending.append((sel.args[k], seq_i, seq_v))
+                elif is_id_type(v):
+                    pending.append((sel.args, k, v))
+
+        await self._resolve_pending(pending)
+
+    async def _resolve_variables(self, variables: dict[str, Any]) -> None:
+        """Resolve Type instances among variable values into their IDs.
+
+        Results are written straight into the variables dict, without
+        touching the (shared) selection args.
+        """
+        pending: list[tuple[Any, str | int, IDType]] = []
+
+        for name, v in variables.items():
+            if is_id_type_sequence(v):
+                # copy, so the caller's sequence isn't mutated
+                copy = variables[name] = list(v)
+                for i, elem in enumerate(copy):
+                    if is_id_type(elem):
+                        pending.append((copy, i, elem))
+            elif is_id_type(v):
+                pending.append((variables, name, v))
+
+        await self._resolve_pending(pending)
+
+    async def _resolve_pending(
+        self, pending: list[tuple[Any, str | int, IDType]]
+    ) -> None:
+        if not pending:
+            return
+
+        if len(pending) == 1:
+            container, key, v = pending[0]
+            container[key] = await v.id()
+            return
+
+        # resolve batches concurrently
+        async with anyio.create_task_group() as tg:
+            for offset in range(0, len(pending), _MAX_ID_BATCH):
+                tg.start_soon(
+                    self._resolve_id_batch,
+                    pending[offset : offset + _MAX_ID_BATCH],
+                )
+
+    async def _resolve_id_batch(
+        self, pending: list[tuple[Any, str | int, IDType]]
+    ) -> None:
+        ctxs = [
+            v._ctx.select(type(v)._graphql_name(), "id", ())  # noqa: SLF001
+            for _, _, v in pending
+        ]
+
+        # an object's own pipeline may hold unresolved IDs too
+        async with anyio.create_task_group() as tg:
+            for ctx in ctxs:
+                tg.start_soon(ctx.resolve_ids)
 
-        async def _resolve_seq_id(pos: int, idx: int, k: str, v: IDType):
-            sel = self.selections[pos]
-            sel.args[k][idx] = await v.id()
+        query = DSLQuery(**{f"a{i}": ctx.build() for i, ctx in enumerate(ctxs)})
+        # already a batch: the batcher only merges single-root documents
+        result = await self._execute(dsl_gql(query), batchable=False)
 
-        # resolve all ids concurrently
-        async with anyio.create_task_group() as tg:
-            for i, sel in enumerate(self.selections):
-                for k, v in sel.args.items():
-                    # check if it's a sequence of Type objects
-                    if is_id_type_sequence(v):
-                        # make sure it's a list, to mutate by index
-                        sel.args[k] = list(v)
-                        for seq_i, seq_v in enumerate(sel.args[k]):
-                            if is_id_type(seq_v):
-                                tg.start_soon(_resolve_seq_id, i, seq_i, k, seq_v)
-                    elif is_id_type(v):
-                        tg.start_soon(_resolve_id, i, k, v)
+        for i, ((container, key, _), ctx) in enumerate(zip(pending, ctxs, strict=True)):
+            value = result[f"a{i}"]
+            # the alias replaces the first field's name in the response
+            for field_ in ctx.selections[1:]:
+                value = value[field_.name]
+            container[key] = value
 
 
 _Type = TypeVar("_Type", bound=Type)
@@ -264,13 +862,15 @@ class Root(Type):
         assert (
             session.client.schema is not None
         ), "GraphQL session has not been initialized"
-        ds = DSLSchema(session.client.schema)
+        ds = _dsl_schema(session.client.schema)
+        if _batching_enabled() and session not in _BATCHERS:
+            _BATCHERS[session] = _ExecuteBatcher(session)
         ctx = Context(session, ds)
         return cls(ctx)
 
     @classmethod
     def from_context(cls, ctx: Context):
-        return cls(replace(ctx, selections=deque()))
+        return cls(Context(ctx.session, ctx.schema))
 
     def _get_object_instance(self, id_: str | Scalar, cls: type[_Type]) -> _Type:
         if not is_id_type_subclass(cls):
@@ -19,6 +19,39 @@ InputTypeSeq = Annotated[Sequence[InputType], ~IsInstance[str]]
 InputSeqHint = TypeHint(InputTypeSeq)
 
 
+@functools.lru_cache(maxsize=4096)
+def _is_input_class(cls: type) -> bool:
+    return issubclass(cls, Input) and is_dataclass(cls)
+
+
+def is_input_type(v: object) -> TypeGuard[Input]:
+    return _is_input_class(type(v))
+
+
+def is_input_sequence(v: object) -> TypeGuard[Sequence[Input]]:
+    cls, elem = _sequence_key(v)
+    return cls is not None and _is_input_sequence_class(cls, elem)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_input_sequence_class(cls: type, elem_cls: type | None) -> bool:
+    if issubclass(cls, str) or not issubclass(cls, Sequence):
+        return False
+    return elem_cls is None or _is_input_class(elem_cls)
+
+
+def _sequence_key(v: object) -> tuple[type | None, type | None]:
+    """Cache key for sequence checks: container type and first element type.
+
+    Like beartype's O(1) sampling, only the first element is looked at.
+    """
+    try:
+        elem = v[0] if v else None  # type: ignore[index]
+    except (TypeError, LookupError):
+        return None, None
+    return type(v), None if elem is None else type(elem)
+
+
 @typing.runtime_checkable
 class FromIDType(typing.Protocol):
     @classmethod
@@ -50,12 +83,25 @@ IDTypeHint = TypeHint(IDType)
 IDTypeSeqHint = TypeHint(IDTypeSeq)
 
 
+@functools.lru_cache(maxsize=4096)
+def _is_id_type_class(cls: type) -> bool:
+    return issubclass(cls, Type) and issubclass(cls, HasID)
+
+
 def is_id_type(v: object) -> TypeGuard[IDType]:
-    return IDTypeHint.is_bearable(v)
+    return _is_id_type_class(type(v))
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_id_type_sequence_class(cls: type, elem_cls: type | None) -> bool:
+    if issubclass(cls, str) or not issubclass(cls, Sequence):
+        return False
+    return elem_cls is None or _is_id_type_class(elem_cls)
 
 
 def is_id_type_sequence(v: object) -> TypeGuard[IDTypeSeq]:
-    return IDTypeSeqHint.is_bearable(v)
+    cls, elem = _sequence_key(v)
+    return cls is not None and _is_id_type_sequence_class(cls, elem)
 
 
 _T = TypeVar("_T")
@@ -22,6 +22,13 @@ from graphql import DocumentNode, ExecutionResult, print_ast
 
 log = logging.getLogger(__name__)
 
+# Decoding large result payloads is significant enough that a faster
+# JSON library is worth using when available.
+try:
+    from orjson import loads as _json_deserialize
+except ImportError:
+    _json_deserialize = json.loads
+
 
 class _HTTPXTransport:
     file_classes: Tuple[Type[Any], ...] = (io.IOBase,)
@@ -32,10 +39,12 @@ class _HTTPXTransport:
         self,
         url: Union[str, httpx.URL],
         json_serialize: Callable = json.dumps,
+        json_deserialize: Callable = _json_deserialize,
         **kwargs,
     ):
         self.url = url
         self.json_serialize = json_serialize
+        self.json_deserialize = json_deserialize
         self.kwargs = kwargs
 
     def _prepare_request(
@@ -78,7 +87,7 @@ class _HTTPXTransport:
             log.debug("<<< %s", response.text)
 
         try:
-            result: Dict[str, Any] = response.json()
+            result: Dict[str, Any] = self.json_deserialize(response.content)
 
         except Exception:
             self._raise_response_error(response, "Not a JSON answer")
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import contextlib
 import enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, get_type_hints
 
 if TYPE_CHECKING:
     from ._core import Context
@@ -43,6 +44,14 @@ class Type(Object):
 
     __slots__ = ("_ctx",)
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Resolve annotations once, at class creation, so structuring
+        # responses doesn't re-evaluate them per object. Forward
+        # references to names not yet defined resolve lazily instead.
+        with contextlib.suppress(NameError):
+            cls.__dagger_hints__ = get_type_hints(cls)
+
     def __init__(self, ctx: Context) -> None:
         self._ctx = ctx
 
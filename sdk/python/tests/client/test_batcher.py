@@ -0,0 +1,157 @@
+import anyio
+import graphql
+import pytest
+from gql.transport.exceptions import TransportQueryError
+
+from dagger import TransportError
+from dagger.client._core import _batching_enabled, _ExecuteBatcher
+
+DOC_A = graphql.parse("query ($v0: String) { a(arg: $v0) { ok } }")
+DOC_B = graphql.parse("query ($v0: String) { b(arg: $v0) { ok } }")
+DOC_C = graphql.parse("{ c { ok } }")
+
+
+class FakeSession:
+    """Records execute calls and delegates the response to a handler."""
+
+    def __init__(self, handler):
+        self.calls = []
+        self.handler = handler
+
+    async def execute(self, document, variable_values=None):
+        self.calls.append((document, variable_values))
+        return await self.handler(document, variable_values)
+
+
+async def echo_roots(document, _variables):
+    """Answer every root selection, keyed by its alias (or name)."""
+    result = {}
+    for sel in document.definitions[0].selection_set.selections:
+        key = sel.alias.value if sel.alias else sel.name.value
+        result[key] = {"ok": sel.name.value}
+    return result
+
+
+@pytest.mark.anyio()
+async def test_merges_concurrent_executions():
+    session = FakeSession(echo_roots)
+    batcher = _ExecuteBatcher(session)
+    results = {}
+
+    async def run(name: str, document, variables):
+        results[name] = await batcher.execute(document, variable_values=variables)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(run, "a", DOC_A, {"v0": "one"})
+        tg.start_soon(run, "b", DOC_B, {"v0": "two"})
+
+    assert len(session.calls) == 1
+    assert session.calls[0][1] == {"q0_v0": "one", "q1_v0": "two"}
+    assert results == {"a": {"a": {"ok": "a"}}, "b": {"b": {"ok": "b"}}}
+
+
+@pytest.mark.anyio()
+async def test_error_fans_out_per_item():
+    async def fail_second(_document, _variables):
+        msg = "boom"
+        raise TransportQueryError(
+            msg,
+            errors=[{"message": "boom", "path": ["q1", "ok"]}],
+            data={"q0": {"ok": "a"}},
+        )
+
+    session = FakeSession(fail_second)
+    batcher = _ExecuteBatcher(session)
+    results = {}
+
+    async def run_ok():
+        results["a"] = await batcher.execute(DOC_A, variable_values={"v0": "one"})
+
+    async def run_err():
+        with pytest.raises(TransportQueryError) as exc_info:
+            await batcher.execute(DOC_B, variable_values={"v0": "two"})
+        results["b"] = exc_info.value.errors
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(run_ok)
+        tg.start_soon(run_err)
+
+    assert results["a"] == {"a": {"ok": "a"}}
+    # the alias is translated back to the field name
+    assert results["b"] == [{"message": "boom", "path": ["b", "ok"]}]
+
+
+@pytest.mark.anyio()
+async def test_cancelled_flush_releases_other_waiters():
+    started = anyio.Event()
+
+    async def hang(_document, _variables):
+        started.set()
+        await anyio.sleep(10)
+
+    session = FakeSession(hang)
+    batcher = _ExecuteBatcher(session)
+    errors = []
+
+    async def owner(*, task_status):
+        with anyio.CancelScope() as scope:
+            task_status.started(scope)
+            await batcher.execute(DOC_A)
+
+    async def waiter():
+        try:
+            await batcher.execute(DOC_B)
+        except TransportError as e:
+            errors.append(e)
+
+    async with anyio.create_task_group() as tg:
+        scope = await tg.start(owner)
+        # make sure the owner's execution arrived first, so it owns the
+        # debounce window and the waiter just waits on its share
+        while not batcher._pending:  # noqa: SLF001
+            await anyio.sleep(0)
+        tg.start_soon(waiter)
+        await started.wait()
+        scope.cancel()
+
+    assert len(errors) == 1
+    assert "interrupted" in str(errors[0])
+
+
+@pytest.mark.anyio()
+async def test_max_batch_flushes_early():
+    session = FakeSession(echo_roots)
+    batcher = _ExecuteBatcher(session)
+    batcher.max_batch = 2
+    results = {}
+
+    async def run(name: str, document):
+        results[name] = await batcher.execute(document)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(run, "a", DOC_A)
+        tg.start_soon(run, "b", DOC_B)
+        tg.start_soon(run, "c", DOC_C)
+
+    # a and b fill a batch and go out immediately; c goes separately
+    assert len(session.calls) == 2
+    assert results == {
+        "a": {"a": {"ok": "a"}},
+        "b": {"b": {"ok": "b"}},
+        "c": {"c": {"ok": "c"}},
+    }
+
+
+@pytest.mark.parametrize("value", ["1", "true", "yes", "on"])
+def test_batching_enabled(monkeypatch, value):
+    monkeypatch.setenv("DAGGER_BATCH_EXECUTIONS", value)
+    assert _batching_enabled()
+
+
+@pytest.mark.parametrize("value", [None, "", "0", "false", "False", "no"])
+def test_batching_disabled(monkeypatch, value):
+    if value is None:
+        monkeypatch.delenv("DAGGER_BATCH_EXECUTIONS", raising=False)
+    else:
+        monkeypatch.setenv("DAGGER_BATCH_EXECUTIONS", value)
+    assert not _batching_enabled()
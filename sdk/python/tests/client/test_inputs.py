@@ -1,4 +1,5 @@
 from collections.abc import Sequence
+from dataclasses import asdict, dataclass
 
 import pytest
 from pytest_lazyfixture import lazy_fixture
@@ -6,9 +7,10 @@ from pytest_lazyfixture import lazy_fixture
 import dagger
 from dagger.client._core import (
     Root,
+    _input_serializer,
 )
 from dagger.client._guards import is_id_type, is_id_type_sequence, typecheck
-from dagger.client.base import Scalar, Type
+from dagger.client.base import Input, Scalar, Type
 
 pytestmark = pytest.mark.filterwarnings("ignore:coroutine")
 
@@ -188,3 +190,30 @@ def test_is_id_type_sequence(client: Client, seq):
 )
 def test_is_not_id_type_sequence(val):
     assert not is_id_type_sequence(val)
+
+
+@dataclass(slots=True)
+class NestedArg(Input):
+    name: str
+    value: str
+
+
+@dataclass(slots=True)
+class OuterArg(Input):
+    nested: NestedArg
+    flag: bool
+
+
+@dataclass(slots=True)
+class ListArg(Input):
+    items: list[NestedArg]
+
+
+def test_input_serializer_nested_matches_asdict():
+    arg = OuterArg(NestedArg("SPAM", "eggs"), flag=True)
+    assert _input_serializer(OuterArg)(arg) == asdict(arg)
+
+
+def test_input_serializer_container_matches_asdict():
+    arg = ListArg([NestedArg("SPAM", "eggs"), NestedArg("HAM", "144")])
+    assert _input_serializer(ListArg)(arg) == asdict(arg)
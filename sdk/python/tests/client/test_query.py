@@ -0,0 +1,98 @@
+import graphql
+import pytest
+from gql.dsl import DSLSchema
+
+from dagger.client._core import Context
+
+_SDL = """
+type Query {
+    container(platform: String): Container
+}
+
+type Container {
+    withEnvVariable(name: String!, value: String!): Container
+    withExec(args: [String!]!, redirectStdout: String): Container
+    envVariable: EnvVariable
+    stdout: String
+}
+
+type EnvVariable {
+    name: String!
+    value: String!
+}
+"""
+
+
+@pytest.fixture(name="ctx")
+def context(mocker):
+    schema = DSLSchema(graphql.build_schema(_SDL))
+    return Context(mocker.MagicMock(), schema)
+
+
+def _pipeline(ctx: Context) -> Context:
+    return (
+        ctx.select_raw("Query", "container", {"platform": "linux/amd64"})
+        .select_raw("Container", "withEnvVariable", {"name": "SPAM", "value": "eggs"})
+        .select_raw(
+            "Container", "withExec", {"args": ["echo"], "redirectStdout": "/out"}
+        )
+        .select_raw("Container", "stdout", {})
+    )
+
+
+def test_variables_match_document_order(ctx: Context):
+    """Pin the ordering contract between `_compile_query` and `_query_variables`.
+
+    Variable names are assigned while compiling the document and values
+    are collected separately; both must walk sorted args, depth first.
+    """
+    doc, variables = _pipeline(ctx).query()
+
+    # map each argument in the compiled document to its variable name
+    arg_vars: dict[str, str] = {}
+
+    class _Collect(graphql.Visitor):
+        def enter_argument(self, node: graphql.ArgumentNode, *_):
+            assert isinstance(node.value, graphql.VariableNode)
+            arg_vars[node.name.value] = node.value.name.value
+
+    graphql.visit(doc, _Collect())
+
+    assert set(variables) == {f"v{i}" for i in range(5)}
+    assert {arg: variables[var] for arg, var in arg_vars.items()} == {
+        "platform": "linux/amd64",
+        "name": "SPAM",
+        "value": "eggs",
+        "args": ["echo"],
+        "redirectStdout": "/out",
+    }
+
+
+def test_same_shape_reuses_document(ctx: Context):
+    doc, _ = _pipeline(ctx).query()
+
+    other = (
+        ctx.select_raw("Query", "container", {"platform": "linux/arm64"})
+        .select_raw("Container", "withEnvVariable", {"name": "HAM", "value": "144"})
+        .select_raw("Container", "withExec", {"args": ["true"], "redirectStdout": "/x"})
+        .select_raw("Container", "stdout", {})
+    )
+    other_doc, other_variables = other.query()
+
+    assert other_doc is doc
+    assert other_variables["v0"] == "linux/arm64"
+
+
+def test_different_aliases_compile_different_documents(ctx: Context):
+    """Aliases are part of the emitted document, so they must key the cache."""
+    base = ctx.select_raw("Query", "container", {}).select_raw(
+        "Container", "envVariable", {}
+    )
+
+    doc, _ = base.select_multiple("EnvVariable", _name="name", _value="value").query()
+    other = base.select_multiple("EnvVariable", spam="name", eggs="value")
+    other_doc, _ = other.query()
+
+    assert other_doc is not doc
+    assert "spam: name" in graphql.print_ast(other_doc)
+    assert "eggs: value" in graphql.print_ast(other_doc)
@@ -1,4 +1,3 @@
-from collections import deque
 from typing import NamedTuple
 
 import pytest
@@ -19,8 +18,10 @@ class F(NamedTuple):
 def context(mocker):
     session = mocker.MagicMock()
     schema = mocker.MagicMock()
-    selections = deque(Field("T", f, {}) for f in ("one", "two", "three"))
-    return Context(session, schema, selections)
+    ctx = Context(session, schema)
+    for name in ("one", "two", "three"):
+        ctx = Context(session, schema, parent=ctx, field=Field("T", name, {}))
+    return ctx
 
 
 def test_none(ctx: Context):